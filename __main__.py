@@ -5,7 +5,6 @@ Main entry point for the agent system
 
 import asyncio
 import logging
-from pathlib import Path
 
 from core.bob_agent import BobAgent
 from config.settings import load_config
@@ -5,7 +5,6 @@ Core Bob Agent - The heart of the Better Organized Brain
 import asyncio
 import logging
 from typing import Dict, Any, Optional
-from datetime import datetime
 
 import ollama
 from core.knowledge_manager import KnowledgeManager
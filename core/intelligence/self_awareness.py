@@ -6,7 +6,6 @@ This module manages Bob's understanding of his own architecture and capabilities
 from dataclasses import dataclass
 from typing import Dict, List, Any, Optional
 from enum import Enum
-import json
 from datetime import datetime
 
 class ComponentStatus(Enum):